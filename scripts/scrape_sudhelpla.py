@@ -5,103 +5,229 @@ Extracts agency listings and service information
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
 import re
 from datetime import datetime
 import os
 import argparse
+import csv
+import hashlib
+import json
 import logging
-from typing import Dict, Tuple
+import math
+from itertools import groupby
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used in the per-agency loop
+_DAY_NAMES = r'Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday'
+_RE_247 = re.compile(r'24/?7|24\s*hours', re.IGNORECASE)
+_RE_DAY_RANGES = re.compile(
+    rf'({_DAY_NAMES})(?:\s*-\s*({_DAY_NAMES}))?\s*:?\s*(\d{{1,2}}:\d{{2}}\s*[AP]M?)\s*-\s*(\d{{1,2}}:\d{{2}}\s*[AP]M?)',
+    re.IGNORECASE)
+# One pass per hours cell: either "Closed" or a range like "8:00AM - 9:00PM"
+_RE_HOURS_CELL = re.compile(
+    r'(?P<closed>(?i:closed))|(?P<open>\d{1,2}:\d{2}[AP]M?)\s*-\s*(?P<close>\d{1,2}:\d{2}[AP]M?)')
+_RE_PHONE = re.compile(r'(\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4})')
+_RE_MILES_PREFIX = re.compile(r'^\d+\.\d+\s+miles\s*')
+_RE_SERVICE = re.compile(r'^(.+?)\s+\(([^)]+)\)$')
+_RE_APPT = re.compile(r'Open Intake Appts:.*?(\d+)')
+
+# Accepted input formats for convert_to_24h, tried in order
+_TIME_FORMATS = ('%I:%M%p', '%I%p', '%H:%M')
+
+_DAY_ORDER = ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday')
+_DAY_INDEX = {day: i for i, day in enumerate(_DAY_ORDER)}
+
+# Listings handed to a worker process at a time, and the default pool size cap;
+# parsing is fast, so more processes mostly add startup cost
+_POOL_CHUNKSIZE = 16
+_DEFAULT_MAX_WORKERS = 8
+# How often the pool path logs parsing progress, in listings
+_PROGRESS_EVERY = 100
+
+# Output columns of the services CSV, in order
+_SERVICE_COLUMNS = ('category', 'service_code', 'service_name', 'description')
+
+# Output columns of the agencies CSV, in order
+_AGENCY_COLUMNS = (
+    'agency_name',
+    'agency_name_secondary',
+    'agency_address',
+    'agency_phone',
+    'agency_website',
+    'agency_wheelchair_access',
+    'available_beds',
+    'intake_open_appointments',
+    'populations_served',
+    'languages_spoken',
+    'last_updated',
+) + tuple(
+    f'{scope}_hours_{day}_{key}'
+    for day in _DAY_ORDER
+    for scope in ['agency', 'intake']
+    for key in ['open', 'close']
+)
+
+def _split_caps(text: str) -> List[str]:
+    """Split text before each capital letter, like re.split(r'(?=[A-Z])', text) without the lookahead"""
+    parts = []
+    start = 0
+    for i, char in enumerate(text):
+        if i and 'A' <= char <= 'Z':
+            parts.append(text[start:i])
+            start = i
+    parts.append(text[start:])
+    return parts
+
+def _find_ancestor(node, class_name: str):
+    """Return the nearest ancestor of node carrying class_name, or None"""
+    node = node.parent
+    while node is not None:
+        if class_name in (node.attributes.get('class') or '').split():
+            return node
+        node = node.parent
+    return None
+
 class SUDHelpLAScraper:
-    def __init__(self, base_url: str = "https://sapccis.ph.lacounty.gov/sbat/"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    # Every output field initialized to '', copied for each agency
+    _EMPTY_AGENCY = dict.fromkeys(_AGENCY_COLUMNS, '')
 
-    def fetch_page(self) -> BeautifulSoup:
-        """Fetch and parse the main page"""
+    def __init__(self, base_url: str = "https://sapccis.ph.lacounty.gov/sbat/",
+                 workers: Optional[int] = None):
+        self.base_url = base_url
+        # Worker processes for agency parsing; None uses up to _DEFAULT_MAX_WORKERS
+        # CPUs, 1 parses in-process
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self.workers = workers
+        # Parsed hours keyed by (headers, times); many agencies share a schedule
+        self._hours_cache = {}
+        # Created on first use, so parse-only scrapers (e.g. in worker processes)
+        # never build the HTTP session
+        self._session = None
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session with pooled keep-alive connections and retries"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+            # Retry transient server errors
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
+    def fetch_content(self) -> bytes:
+        """Fetch the raw bytes of the main page"""
         try:
             response = self.session.get(self.base_url)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
         except requests.RequestException as e:
             logger.error(f"Error fetching page: {e}")
             raise
 
-    def extract_service_types(self, soup: BeautifulSoup) -> pd.DataFrame:
+        return response.content
+
+    def fetch_page(self) -> LexborHTMLParser:
+        """Fetch and parse the main page"""
+        return LexborHTMLParser(self.fetch_content())
+
+    def extract_service_types(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
         """Extract service types and their descriptions with proper namespacing"""
-        service_types = []
+        # Keyed by (category, service_name) so duplicates are dropped on insert
+        # while preserving first-seen order
+        service_types = {}
         
         # Find the filter container
-        filter_container = soup.find('div', {'id': 'filterContainer'})
+        filter_container = tree.css_first('div#filterContainer')
         if not filter_container:
             logger.warning("Filter container not found")
-            return pd.DataFrame(columns=['category', 'service_code', 'service_name', 'description'])
+            return []
 
         # Find the accordion container
-        accordion = filter_container.find('div', {'id': 'accordion'})
+        accordion = filter_container.css_first('div#accordion')
         if not accordion:
             logger.warning("Accordion container not found")
-            return pd.DataFrame(columns=['category', 'service_code', 'service_name', 'description'])
+            return []
+
+        # Select every checkbox in one CSS pass and handle them grouped by their
+        # accordion section, so sections without checkboxes are never indexed
+        checkboxes = accordion.css('div.accordion-item div.accordion-collapse input[type=checkbox]')
+
+        # Group on mem_id: node equality falls back to comparing serialized HTML,
+        # which would merge adjacent sections with identical markup
+        sections = ((_find_ancestor(checkbox, 'accordion-collapse'), checkbox) for checkbox in checkboxes)
+        for _, section in groupby(sections, key=lambda pair: pair[0].mem_id):
+            section = list(section)
+            collapse = section[0][0]
+            section_checkboxes = [checkbox for _, checkbox in section]
+            item = _find_ancestor(collapse, 'accordion-item')
 
-        # Process each accordion item
-        accordion_items = accordion.find_all('div', class_='accordion-item')
-        
-        for item in accordion_items:
             # Get the accordion header (category)
-            header = item.find('h2', class_='accordion-header')
+            header = item.css_first('h2.accordion-header')
             category = "Unknown"
             if header:
-                button = header.find('button')
+                button = header.css_first('button')
                 if button:
-                    category = button.get_text(strip=True).rstrip(':')
-
-            # Get the collapse content
-            collapse = item.find('div', class_='accordion-collapse')
-            if not collapse:
-                continue
+                    category = button.text(strip=True).rstrip(':')
+
+            # Index labels once per section: each label's text is extracted a single
+            # time for both passes below, and checkboxes find their label in O(1)
+            # Keyed by mem_id: node equality falls back to comparing serialized HTML
+            label_texts = {}
+            labels_by_for = {}
+            for label in collapse.css('label'):
+                label_texts[label.mem_id] = label.text(strip=True)
+                for_id = label.attributes.get('for')
+                if for_id is not None:
+                    labels_by_for.setdefault(for_id, label)
 
             # First, look for tooltips in this section
-            tooltips = collapse.find_all('span', class_='fa fa-question-circle')
+            tooltips = collapse.css('span.fa.fa-question-circle')
             tooltip_descriptions = {}
             
             for tooltip in tooltips:
                 # Get the description from tooltip attributes
-                description = (tooltip.get('title') or 
-                              tooltip.get('data-bs-original-title') or 
-                              tooltip.get('aria-label', ''))
+                attrs = tooltip.attributes
+                description = (attrs.get('title') or 
+                              attrs.get('data-bs-original-title') or 
+                              attrs.get('aria-label') or '')
                 
                 # Find the associated label in the same container
                 container = tooltip.parent
                 if container:
-                    label_elem = container.find('label')
+                    label_elem = container.css_first('label')
                     if label_elem:
-                        full_service_text = label_elem.get_text(strip=True)
+                        full_service_text = label_texts[label_elem.mem_id]
                         tooltip_descriptions[full_service_text] = description
 
             # Process all checkboxes in this section
-            checkboxes = collapse.find_all('input', type='checkbox')
-            for checkbox in checkboxes:
-                checkbox_id = checkbox.get('id', '')
+            for checkbox in section_checkboxes:
+                checkbox_id = checkbox.attributes.get('id') or ''
                 # Find associated label
-                label_elem = collapse.find('label', {'for': checkbox_id})
+                label_elem = labels_by_for.get(checkbox_id)
                 if label_elem:
-                    full_service_text = label_elem.get_text(strip=True)
+                    full_service_text = label_texts[label_elem.mem_id]
                     
                     if full_service_text:  # Make sure it's not empty
                         # Get description from tooltip if available
                         description = tooltip_descriptions.get(full_service_text, '')
                         
                         # Extract service code and name
-                        service_match = re.search(r'^(.+?)\s+\(([^)]+)\)$', full_service_text)
+                        service_match = _RE_SERVICE.search(full_service_text)
                         if service_match:
                             service_name = service_match.group(1).strip()
                             service_code = service_match.group(2).strip()
@@ -109,28 +235,18 @@ class SUDHelpLAScraper:
                             service_name = full_service_text
                             service_code = ''
                         
-                        service_types.append({
+                        service_types.setdefault((category, service_name), {
                             'category': category,
                             'service_code': service_code,
                             'service_name': service_name,
                             'description': description
                         })
 
-        # Remove duplicates based on category + service_name while preserving order
-        seen = set()
-        unique_services = []
-        for service in service_types:
-            key = (service['category'], service['service_name'])
-            if key not in seen:
-                seen.add(key)
-                unique_services.append(service)
-
-        return pd.DataFrame(unique_services)
+        return list(service_types.values())
 
     def parse_hours(self, hours_text: str) -> Dict[str, Dict[str, str]]:
         """Parse business hours text into structured format"""
-        hours = {day: {'open': '', 'close': ''} for day in 
-                ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']}
+        hours = {day: {'open': '', 'close': ''} for day in _DAY_ORDER}
         
         if not hours_text:
             return hours
@@ -141,13 +257,13 @@ class SUDHelpLAScraper:
         # "24/7" or "24 hours"
         
         # Handle 24/7 or 24 hours
-        if re.search(r'24/?7|24\s*hours', hours_text, re.IGNORECASE):
+        if _RE_247.search(hours_text):
             for day in hours.keys():
                 hours[day] = {'open': '00:00', 'close': '23:59'}
             return hours
 
         # Handle ranges like "Mon-Fri" or "Monday-Friday"
-        day_ranges = re.findall(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)(?:\s*-\s*(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday))?\s*:?\s*(\d{1,2}:\d{2}\s*[AP]M?)\s*-\s*(\d{1,2}:\d{2}\s*[AP]M?)', hours_text, re.IGNORECASE)
+        day_ranges = _RE_DAY_RANGES.findall(hours_text)
         
         day_mapping = {
             'mon': 'monday', 'tue': 'tuesday', 'wed': 'wednesday', 'thu': 'thursday',
@@ -165,30 +281,33 @@ class SUDHelpLAScraper:
             open_24h = self.convert_to_24h(open_time)
             close_24h = self.convert_to_24h(close_time)
 
-            # Apply to day range
-            day_list = list(day_mapping.values())
-            if start_day in day_list and end_day in day_list:
-                start_idx = day_list.index(start_day)
-                end_idx = day_list.index(end_day)
-                for i in range(start_idx, end_idx + 1):
-                    hours[day_list[i]] = {'open': open_24h, 'close': close_24h}
+            # Apply to day range, wrapping past Saturday for ranges like "Mon-Sun"
+            if start_day in _DAY_INDEX and end_day in _DAY_INDEX:
+                start_idx = _DAY_INDEX[start_day]
+                end_idx = _DAY_INDEX[end_day]
+                for i in range((end_idx - start_idx) % 7 + 1):
+                    hours[_DAY_ORDER[(start_idx + i) % 7]] = {'open': open_24h, 'close': close_24h}
 
         return hours
 
     def parse_hours_table(self, table) -> Dict[str, Dict[str, str]]:
         """Parse hours from HTML table"""
-        hours = {day: {'open': '', 'close': ''} for day in 
-                ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']}
+        hours = {day: {'open': '', 'close': ''} for day in _DAY_ORDER}
         
         try:
-            rows = table.find_all('tr')
+            rows = table.css('tr')
             if len(rows) >= 2:
                 # First row should have day headers, second row should have times
                 header_row = rows[0]
                 times_row = rows[1]
                 
-                headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
-                times = [td.get_text(strip=True) for td in times_row.find_all(['th', 'td'])]
+                headers = [th.text(strip=True) for th in header_row.css('th, td')]
+                times = [td.text(strip=True) for td in times_row.css('th, td')]
+
+                key = (tuple(headers), tuple(times))
+                cached = self._hours_cache.get(key)
+                if cached is not None:
+                    return cached
                 
                 day_mapping = {
                     'sun': 'sunday', 'mon': 'monday', 'tue': 'tuesday', 'wed': 'wednesday',
@@ -197,16 +316,20 @@ class SUDHelpLAScraper:
                 
                 for header, time_cell in zip(headers, times):
                     day_key = day_mapping.get(header.lower())
-                    if day_key:
-                        if 'closed' in time_cell.lower():
-                            hours[day_key] = {'open': 'Closed', 'close': 'Closed'}
-                        else:
-                            # Parse time ranges like "8:00AM - 9:00PM"
-                            time_match = re.search(r'(\d{1,2}:\d{2}[AP]M?)\s*-\s*(\d{1,2}:\d{2}[AP]M?)', time_cell)
-                            if time_match:
-                                open_time = self.convert_to_24h(time_match.group(1))
-                                close_time = self.convert_to_24h(time_match.group(2))
-                                hours[day_key] = {'open': open_time, 'close': close_time}
+                    if not day_key:
+                        continue
+                    # Match "Closed" or a time range like "8:00AM - 9:00PM" in one pass
+                    cell_match = _RE_HOURS_CELL.search(time_cell)
+                    if not cell_match:
+                        continue
+                    if cell_match.lastgroup == 'closed':
+                        hours[day_key] = {'open': 'Closed', 'close': 'Closed'}
+                    else:
+                        open_time = self.convert_to_24h(cell_match.group('open'))
+                        close_time = self.convert_to_24h(cell_match.group('close'))
+                        hours[day_key] = {'open': open_time, 'close': close_time}
+
+                self._hours_cache[key] = hours
         except Exception as e:
             logger.error(f"Error parsing hours table: {e}")
         
@@ -214,111 +337,65 @@ class SUDHelpLAScraper:
 
     def convert_to_24h(self, time_str: str) -> str:
         """Convert 12-hour format to 24-hour format"""
-        try:
-            # Handle formats like "9:00 AM", "9:00AM", "9AM"
-            time_str = re.sub(r'\s+', '', time_str.upper())
-            
-            if 'AM' in time_str:
-                time_part = time_str.replace('AM', '')
-                if ':' not in time_part:
-                    time_part += ':00'
-                hour, minute = time_part.split(':')
-                hour = int(hour)
-                if hour == 12:
-                    hour = 0
-                return f"{hour:02d}:{minute}"
-            elif 'PM' in time_str:
-                time_part = time_str.replace('PM', '')
-                if ':' not in time_part:
-                    time_part += ':00'
-                hour, minute = time_part.split(':')
-                hour = int(hour)
-                if hour != 12:
-                    hour += 12
-                return f"{hour:02d}:{minute}"
-            else:
-                # Assume 24-hour format already
-                return time_str
-        except:
-            return time_str
+        # Handle formats like "9:00 AM", "9:00AM", "9AM"; 24-hour times are normalized too
+        time_str = ''.join(time_str.upper().split())
+        for time_format in _TIME_FORMATS:
+            try:
+                return datetime.strptime(time_str, time_format).strftime('%H:%M')
+            except ValueError:
+                pass
+        return time_str
 
     def parse_agency_data(self, agency_div) -> Dict:
         """Parse individual agency listing"""
-        data = {}
-
-        # Initialize all fields
-        data.update({
-            'agency_name': '',
-            'agency_name_secondary': '',
-            'agency_address': '',
-            'agency_phone': '',
-            'agency_website': '',
-            'agency_wheelchair_access': '',
-            'available_beds': '',
-            'intake_open_appointments': '',
-            'populations_served': '',
-            'languages_spoken': '',
-            'last_updated': ''
-        })
-
-        # Add hour fields
-        for day in ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']:
-            data[f'agency_hours_{day}_open'] = ''
-            data[f'agency_hours_{day}_close'] = ''
-            data[f'intake_hours_{day}_open'] = ''
-            data[f'intake_hours_{day}_close'] = ''
+        # Start from the shared all-empty record instead of rebuilding it per agency
+        data = self._EMPTY_AGENCY.copy()
 
         try:
             # Extract Agency information from 'listing' div
-            listing_div = agency_div.find('div', class_='listing')
+            listing_div = agency_div.css_first('div.listing')
             if listing_div:
                 # Agency name - look for <strong> tag
-                name_elem = listing_div.find('strong')
+                name_elem = listing_div.css_first('strong')
                 if name_elem:
-                    data['agency_name'] = name_elem.get_text(strip=True)
+                    data['agency_name'] = name_elem.text(strip=True)
 
                 # Secondary agency name
-                secondary_div = listing_div.find('div', class_='secondname')
+                secondary_div = listing_div.css_first('div.secondname')
                 if secondary_div:
-                    secondary_span = secondary_div.find('span')
+                    secondary_span = secondary_div.css_first('span')
                     if secondary_span:
-                        data['agency_name_secondary'] = secondary_span.get_text(strip=True)
+                        data['agency_name_secondary'] = secondary_span.text(strip=True)
 
                 # Address
-                address_div = listing_div.find('div', class_='address')
+                address_div = listing_div.css_first('div.address')
                 if address_div:
-                    # Extract address text, excluding the direction link
-                    address_text = address_div.get_text(strip=True)
-                    # Remove the "X.XX miles" part at the beginning
-                    address_clean = re.sub(r'^\d+\.\d+\s+miles\s*', '', address_text)
-                    data['agency_address'] = address_clean
+                    # Raw address text; the "X.XX miles" prefix is removed in scrape_agencies
+                    data['agency_address'] = address_div.text(strip=True)
 
                 # Phone
-                phone_div = listing_div.find('div', class_='phone')
+                phone_div = listing_div.css_first('div.phone')
                 if phone_div:
-                    phone_text = phone_div.get_text(strip=True)
-                    # Extract just the phone number
-                    phone_match = re.search(r'\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}', phone_text)
-                    if phone_match:
-                        data['agency_phone'] = phone_match.group()
+                    # Raw phone text; the number itself is extracted in scrape_agencies
+                    data['agency_phone'] = phone_div.text(strip=True)
 
                 # Website
-                web_div = listing_div.find('div', class_='web')
+                web_div = listing_div.css_first('div.web')
                 if web_div:
-                    website_elem = web_div.find('a')
+                    website_elem = web_div.css_first('a')
                     if website_elem:
-                        data['agency_website'] = website_elem.get('href', '')
+                        data['agency_website'] = website_elem.attributes.get('href') or ''
 
                 # Wheelchair accessibility
-                wheelchair_div = listing_div.find('div', class_='wheel-access')
+                wheelchair_div = listing_div.css_first('div.wheel-access')
                 if wheelchair_div:
-                    wheelchair_text = wheelchair_div.get_text(strip=True)
+                    wheelchair_text = wheelchair_div.text(strip=True)
                     data['agency_wheelchair_access'] = 'Yes' if 'yes' in wheelchair_text.lower() else 'No'
 
                 # Business hours from table
-                hours_div = listing_div.find('div', class_='hours')
+                hours_div = listing_div.css_first('div.hours')
                 if hours_div:
-                    table = hours_div.find('table')
+                    table = hours_div.css_first('table')
                     if table:
                         agency_hours = self.parse_hours_table(table)
                         for day, times in agency_hours.items():
@@ -326,23 +403,23 @@ class SUDHelpLAScraper:
                             data[f'agency_hours_{day}_close'] = times['close']
 
             # Extract Available Beds
-            beds_div = agency_div.find('div', class_='available-beds')
+            beds_div = agency_div.css_first('div.available-beds')
             if beds_div:
-                beds_text = beds_div.get_text(strip=True)
+                beds_text = beds_div.text(strip=True)
                 data['available_beds'] = beds_text
 
             # Extract Intake Information
-            intake_div = agency_div.find('div', class_='intake-info')
+            intake_div = agency_div.css_first('div.intake-info')
             if intake_div:
-                intake_text = intake_div.get_text()
+                intake_text = intake_div.text()
                 
                 # Extract number of open appointments
-                appt_match = re.search(r'Open Intake Appts:.*?(\d+)', intake_text)
+                appt_match = _RE_APPT.search(intake_text)
                 if appt_match:
                     data['intake_open_appointments'] = appt_match.group(1)
 
                 # Parse intake hours table if present
-                table = intake_div.find('table')
+                table = intake_div.css_first('table')
                 if table:
                     intake_hours = self.parse_hours_table(table)
                     for day, times in intake_hours.items():
@@ -350,52 +427,80 @@ class SUDHelpLAScraper:
                         data[f'intake_hours_{day}_close'] = times['close']
 
             # Extract Populations Served
-            service_div = agency_div.find('div', class_='service-type')
+            service_div = agency_div.css_first('div.service-type')
             if service_div:
-                service_text = service_div.get_text(strip=True)
-                # Split by common delimiters and clean up
-                populations = re.split(r'(?=[A-Z])', service_text)
-                populations = [p.strip() for p in populations if p.strip()]
-                data['populations_served'] = '; '.join(populations)
+                # Raw text; split into '; '-separated populations in scrape_agencies
+                data['populations_served'] = service_div.text(strip=True)
 
             # Extract Languages Spoken
-            languages_div = agency_div.find('div', class_='languages-spoken')
+            languages_div = agency_div.css_first('div.languages-spoken')
             if languages_div:
-                languages_text = languages_div.get_text(strip=True)
+                languages_text = languages_div.text(strip=True)
                 data['languages_spoken'] = languages_text
 
             # Extract last update
-            last_update_div = agency_div.find('div', class_='last-update')
+            last_update_div = agency_div.css_first('div.last-update')
             if last_update_div:
-                data['last_updated'] = last_update_div.get_text(strip=True)
+                data['last_updated'] = last_update_div.text(strip=True)
 
         except Exception as e:
             logger.error(f"Error parsing agency data: {e}")
 
         return data
 
-    def scrape_agencies(self, soup: BeautifulSoup) -> pd.DataFrame:
+    def scrape_agencies(self, tree: LexborHTMLParser) -> pd.DataFrame:
         """Extract all agency listings"""
-        agencies = []
+        # Build the frame column-wise to skip per-row key hashing and dtype inference
+        columns = {column: [] for column in _AGENCY_COLUMNS}
 
         # Find the main agencies container
-        agencies_container = soup.find('div', class_='agencies')
+        agencies_container = tree.css_first('div.agencies')
         if not agencies_container:
             logger.error("Agencies container not found")
             return pd.DataFrame()
 
         # Find all agency listing rows
-        agency_rows = agencies_container.find_all('div', class_='agency-listing row')
+        agency_rows = agencies_container.css('div.agency-listing.row')
         logger.info(f"Found {len(agency_rows)} agency listings")
 
-        for i, agency_div in enumerate(agency_rows):
-            logger.info(f"Processing agency {i+1}/{len(agency_rows)}")
-            agency_data = self.parse_agency_data(agency_div)
-            agencies.append(agency_data)
-
-        return pd.DataFrame(agencies)
-
-    def save_data(self, agencies_df: pd.DataFrame, services_df: pd.DataFrame, output_dir: str):
+        # Never start more workers than there are chunks of listings to hand out
+        workers = self.workers or min(os.cpu_count() or 1, _DEFAULT_MAX_WORKERS)
+        workers = min(workers, math.ceil(len(agency_rows) / _POOL_CHUNKSIZE))
+
+        # Rows are appended to the column lists as they are parsed, so no
+        # intermediate list of per-agency records is held in memory
+        if workers <= 1:
+            for i, agency_div in enumerate(agency_rows):
+                logger.info(f"Processing agency {i+1}/{len(agency_rows)}")
+                agency_data = self.parse_agency_data(agency_div)
+                for column, values in columns.items():
+                    values.append(agency_data[column])
+        else:
+            # Each listing is independent, so ship the row HTML to worker processes;
+            # imap (rather than imap_unordered) keeps the page order
+            logger.info(f"Processing agencies with {workers} workers")
+            with Pool(processes=workers) as pool:
+                row_html = (agency_div.html for agency_div in agency_rows)
+                parsed = pool.imap(_parse_agency_html, row_html, chunksize=_POOL_CHUNKSIZE)
+                for i, agency_data in enumerate(parsed, 1):
+                    for column, values in columns.items():
+                        values.append(agency_data[column])
+                    if i % _PROGRESS_EVERY == 0 or i == len(agency_rows):
+                        logger.info(f"Processed agency {i}/{len(agency_rows)}")
+
+        agencies_df = pd.DataFrame(columns, columns=list(_AGENCY_COLUMNS), dtype=str)
+
+        # Normalize free-text fields over whole columns instead of per agency
+        agencies_df['agency_address'] = agencies_df['agency_address'].str.replace(
+            _RE_MILES_PREFIX, '', regex=True)
+        agencies_df['agency_phone'] = agencies_df['agency_phone'].str.extract(
+            _RE_PHONE, expand=False).fillna('')
+        agencies_df['populations_served'] = agencies_df['populations_served'].map(
+            lambda text: '; '.join(filter(None, (part.strip() for part in _split_caps(text)))))
+
+        return agencies_df
+
+    def save_data(self, agencies_df: pd.DataFrame, services: List[Dict[str, str]], output_dir: str):
         """Save data to CSV files with timestamp"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -407,36 +512,110 @@ class SUDHelpLAScraper:
         agencies_df.to_csv(agencies_file, index=False)
         logger.info(f"Saved {len(agencies_df)} agency records to {agencies_file}")
 
-        # Save services data
+        # Save services data; the table is tiny, so write it directly without pandas
         services_file = os.path.join(output_dir, f"sudhelpla_services_{timestamp}.csv")
-        services_df.to_csv(services_file, index=False)
-        logger.info(f"Saved {len(services_df)} service records to {services_file}")
+        with open(services_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_SERVICE_COLUMNS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(services)
+        logger.info(f"Saved {len(services)} service records to {services_file}")
 
         return agencies_file, services_file
 
-    def run(self, output_dir: str = "/home/fabricehc/SUD-BedWatch/data") -> Tuple[str, str]:
+    def _load_last_run(self, path: str) -> Optional[Dict[str, str]]:
+        """Read the last-run record, treating a missing or damaged file as a cache miss"""
+        try:
+            with open(path) as f:
+                last_run = json.load(f)
+            last_run = {key: last_run[key] for key in ('digest', 'agencies_file', 'services_file')}
+            if not all(isinstance(value, str) for value in last_run.values()):
+                raise ValueError("unexpected field types")
+            return last_run
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable last-run record {path}: {e}")
+            return None
+
+    def _save_last_run(self, path: str, last_run: Dict[str, str]):
+        """Write the last-run record atomically so an interrupted run can't corrupt it"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(last_run, f)
+        os.replace(tmp_path, path)
+
+    def run(self, output_dir: str = "/home/fabricehc/SUD-BedWatch/data",
+            force: bool = False) -> Tuple[str, str]:
         """Main scraping workflow"""
         logger.info("Starting SUD BedWatch scraper")
         
         # Fetch page
         logger.info("Fetching page...")
-        soup = self.fetch_page()
+        content = self.fetch_content()
+
+        # Skip parsing entirely if the page is byte-identical to the last run
+        digest = hashlib.sha1(content).hexdigest()
+        cache_dir = os.path.join(output_dir, '.cache')
+        last_run_file = os.path.join(cache_dir, 'last_run.json')
+        last_run = None if force else self._load_last_run(last_run_file)
+        if (last_run and last_run['digest'] == digest and
+                os.path.exists(last_run['agencies_file']) and
+                os.path.exists(last_run['services_file'])):
+            logger.info("Page unchanged since last run, reusing previous CSVs")
+            return last_run['agencies_file'], last_run['services_file']
+
+        os.makedirs(cache_dir, exist_ok=True)
+        snapshot_name = f"{digest}.html"
+        with open(os.path.join(cache_dir, snapshot_name), 'wb') as f:
+            f.write(content)
+        tree = LexborHTMLParser(content)
         
         # Extract service types
         logger.info("Extracting service types...")
-        services_df = self.extract_service_types(soup)
+        services = self.extract_service_types(tree)
         
         # Extract agencies
         logger.info("Extracting agency data...")
-        agencies_df = self.scrape_agencies(soup)
+        agencies_df = self.scrape_agencies(tree)
         
         # Save data
         logger.info("Saving data...")
-        agencies_file, services_file = self.save_data(agencies_df, services_df, output_dir)
+        agencies_file, services_file = self.save_data(agencies_df, services, output_dir)
+        self._save_last_run(last_run_file, {'digest': digest,
+                                            'agencies_file': agencies_file,
+                                            'services_file': services_file})
+
+        # Keep only the snapshot of the page that was just parsed
+        for name in os.listdir(cache_dir):
+            if name.endswith('.html') and name != snapshot_name:
+                try:
+                    os.remove(os.path.join(cache_dir, name))
+                except OSError as e:
+                    logger.warning(f"Could not remove old page snapshot {name}: {e}")
         
         logger.info("Scraping completed successfully")
         return agencies_file, services_file
 
+_worker_scraper = None
+
+def _parse_agency_html(html: str) -> Dict:
+    """Parse one serialized agency listing (runs in a worker process)"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = SUDHelpLAScraper()
+    agency_div = LexborHTMLParser(html).css_first('div.agency-listing')
+    return _worker_scraper.parse_agency_data(agency_div)
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Scrape SUD BedWatch data from sudhelpla.org')
     parser.add_argument('--output-dir', '-o', 
@@ -445,6 +624,10 @@ def main():
     parser.add_argument('--url', '-u',
                        default='https://sapccis.ph.lacounty.gov/sbat/',
                        help='URL to scrape')
+    parser.add_argument('--workers', '-w', type=_positive_int, default=None,
+                       help='Worker processes for parsing agencies (default: CPU count, at most 8; 1 disables multiprocessing)')
+    parser.add_argument('--force', '-f', action='store_true',
+                       help='Re-parse and save even if the page is unchanged since the last run')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -454,8 +637,8 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        scraper = SUDHelpLAScraper(args.url)
-        agencies_file, services_file = scraper.run(args.output_dir)
+        scraper = SUDHelpLAScraper(args.url, workers=args.workers)
+        agencies_file, services_file = scraper.run(args.output_dir, force=args.force)
         print(f"SUCCESS: Data saved to:")
         print(f"  Agencies: {agencies_file}")
         print(f"  Services: {services_file}")